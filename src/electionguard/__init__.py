@@ -97,11 +97,14 @@ from electionguard.chaum_pedersen import (
     ChaumPedersenProof,
     ConstantChaumPedersenProof,
     DisjunctiveChaumPedersenProof,
+    DisjunctiveVerifier,
+    get_disjunctive_verifier,
     make_chaum_pedersen,
     make_constant_chaum_pedersen,
     make_disjunctive_chaum_pedersen,
     make_disjunctive_chaum_pedersen_one,
     make_disjunctive_chaum_pedersen_zero,
+    verify_disjunctive_batch,
 )
 from electionguard.constants import (
     EXTRA_SMALL_TEST_CONSTANTS,
@@ -240,12 +243,17 @@ from electionguard.group import (
     int_to_hex,
     int_to_p,
     int_to_q,
+    make_base_table,
+    mult_exp_p,
     mult_inv_p,
     mult_p,
     mult_q,
     negate_q,
     pow_p,
+    pow_p_with_table,
+    pow_pk,
     pow_q,
+    powmod_batch,
     rand_q,
     rand_range_q,
 )
@@ -434,6 +442,7 @@ __all__ = [
     "DecryptionShare",
     "DiscreteLog",
     "DisjunctiveChaumPedersenProof",
+    "DisjunctiveVerifier",
     "ELGAMAL_PUBLIC_KEY",
     "ELGAMAL_SECRET_KEY",
     "ENCRYPTED_MESSAGE",
@@ -609,6 +618,7 @@ __all__ = [
     "get_ballots",
     "get_cofactor",
     "get_constants",
+    "get_disjunctive_verifier",
     "get_file_handler",
     "get_generator",
     "get_hash_for_device",
@@ -641,6 +651,7 @@ __all__ = [
     "log_remove_handler",
     "log_warning",
     "logs",
+    "make_base_table",
     "make_chaum_pedersen",
     "make_ciphertext_ballot",
     "make_ciphertext_ballot_contest",
@@ -654,6 +665,7 @@ __all__ = [
     "make_schnorr_proof",
     "manifest",
     "match_optional",
+    "mult_exp_p",
     "mult_inv_p",
     "mult_p",
     "mult_q",
@@ -661,7 +673,10 @@ __all__ = [
     "nonces",
     "partially_decrypt",
     "pow_p",
+    "pow_p_with_table",
+    "pow_pk",
     "pow_q",
+    "powmod_batch",
     "proof",
     "publish_guardian_record",
     "rand_q",
@@ -687,6 +702,7 @@ __all__ = [
     "to_ticks",
     "type",
     "utils",
+    "verify_disjunctive_batch",
     "verify_election_partial_key_backup",
     "verify_election_partial_key_challenge",
     "verify_polynomial_coordinate",
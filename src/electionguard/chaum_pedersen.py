@@ -1,13 +1,20 @@
 # pylint: disable=too-many-instance-attributes
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from .elgamal import ElGamalCiphertext
 from .group import (
+    BaseElement,
     ElementModQ,
     ElementModP,
     g_pow_p,
+    make_base_table,
     mult_p,
     pow_p,
+    pow_p_with_table,
+    pow_pk,
+    powmod_batch,
     a_minus_b_q,
     a_plus_bc_q,
     add_q,
@@ -19,6 +26,37 @@ from .hash import hash_elems
 from .logs import log_warning
 from .nonces import Nonces
 from .proof import Proof, ProofUsage
+from .scheduler import Scheduler
+
+
+_BASE_TABLE_WINDOW = 5
+"""Window width, in bits, for the per-base tables shared within a verification."""
+
+
+def _hex_fields(proof: Proof) -> Dict[str, Any]:
+    """
+    Format a proof's element fields as hex for diagnostics.
+
+    Hex conversion of a big integer is linear in its size where decimal
+    conversion is quadratic, which matters for 4096-bit proof elements.
+    """
+    return {
+        name: value.to_hex() if isinstance(value, BaseElement) else value
+        for name, value in vars(proof).items()
+    }
+
+
+def _log_and_false(proof_name: str, diagnostics: Callable[[], Dict[str, Any]]) -> bool:
+    """
+    Log the diagnostics of a failed proof validation and return False.
+
+    Shared failure path for the proof verifiers, so each verifier can bail out
+    at its first failed check while keeping a single place that formats the
+    diagnostic dictionary. The diagnostics callable is only invoked if warning
+    logging is actually enabled.
+    """
+    log_warning(lambda: f"found an invalid {proof_name} proof: {diagnostics()}")
+    return False
 
 
 @dataclass
@@ -51,12 +89,28 @@ class DisjunctiveChaumPedersenProof(Proof):
     def __post_init__(self) -> None:
         super().__init__()
 
-    def is_valid(
-        self, message: ElGamalCiphertext, k: ElementModP, q: ElementModQ
+    def is_valid(  # pylint: disable=too-many-return-statements
+        self,
+        message: ElGamalCiphertext,
+        k: ElementModP,
+        q: ElementModQ,
+        *,
+        _add_q: Callable = add_q,
+        _g_pow_p: Callable = g_pow_p,
+        _hash_elems: Callable = hash_elems,
+        _make_base_table: Callable = make_base_table,
+        _mult_p: Callable = mult_p,
+        _pow_p_with_table: Callable = pow_p_with_table,
+        _pow_pk: Callable = pow_pk,
     ) -> bool:
         """
         Validates a "disjunctive" Chaum-Pedersen (zero or one) proof.
 
+        The keyword-only underscore parameters bind the group helpers as
+        default-argument locals, trading module-global lookups for the faster
+        local-variable path on this tally-scale hot loop; callers never pass
+        them.
+
         :param message: The ciphertext message
         :param k: The public key of the election
         :param q: The extended base hash of the election
@@ -74,68 +128,68 @@ class DisjunctiveChaumPedersenProof(Proof):
         c = self.challenge
         v0 = self.proof_zero_response
         v1 = self.proof_one_response
-        in_bounds_alpha = alpha.is_valid_residue()
-        in_bounds_beta = beta.is_valid_residue()
-        in_bounds_a0 = a0.is_valid_residue()
-        in_bounds_b0 = b0.is_valid_residue()
-        in_bounds_a1 = a1.is_valid_residue()
-        in_bounds_b1 = b1.is_valid_residue()
-        in_bounds_c0 = c0.is_in_bounds()
-        in_bounds_c1 = c1.is_in_bounds()
-        in_bounds_v0 = v0.is_in_bounds()
-        in_bounds_v1 = v1.is_in_bounds()
-        consistent_c = add_q(c0, c1) == c == hash_elems(q, alpha, beta, a0, b0, a1, b1)
-        consistent_gv0 = g_pow_p(v0) == mult_p(a0, pow_p(alpha, c0))
-        consistent_gv1 = g_pow_p(v1) == mult_p(a1, pow_p(alpha, c1))
-        consistent_kv0 = pow_p(k, v0) == mult_p(b0, pow_p(beta, c0))
-        consistent_gc1kv1 = mult_p(g_pow_p(c1), pow_p(k, v1)) == mult_p(
-            b1, pow_p(beta, c1)
-        )
+        checks: Dict[str, Any] = {}
 
-        success = (
-            in_bounds_alpha
-            and in_bounds_beta
-            and in_bounds_a0
-            and in_bounds_b0
-            and in_bounds_a1
-            and in_bounds_b1
-            and in_bounds_c0
-            and in_bounds_c1
-            and in_bounds_v0
-            and in_bounds_v1
-            and consistent_c
-            and consistent_gv0
-            and consistent_gv1
-            and consistent_kv0
-            and consistent_gc1kv1
+        def fail() -> bool:
+            return _log_and_false(
+                "Disjunctive Chaum-Pedersen",
+                lambda: {**checks, "k": k.to_hex(), "proof": _hex_fields(self)},
+            )
+
+        # Evaluate the cheap range and membership checks first, so that
+        # malformed proofs never pay for the modexp-heavy consistency
+        # checks below. Only alpha and beta need a full residue check (one
+        # modexp by Q each): once the consistency equations below hold, each
+        # of a0, b0, a1, b1 equals a product of generator powers, public-key
+        # powers, and powers of alpha or beta, all of which lie in the
+        # subgroup — so their membership follows and a range check suffices.
+        checks["in_bounds_alpha"] = alpha.is_valid_residue()
+        checks["in_bounds_beta"] = beta.is_valid_residue()
+        checks["in_bounds_a0"] = a0.is_in_bounds()
+        checks["in_bounds_b0"] = b0.is_in_bounds()
+        checks["in_bounds_a1"] = a1.is_in_bounds()
+        checks["in_bounds_b1"] = b1.is_in_bounds()
+        checks["in_bounds_c0"] = c0.is_in_bounds()
+        checks["in_bounds_c1"] = c1.is_in_bounds()
+        checks["in_bounds_v0"] = v0.is_in_bounds()
+        checks["in_bounds_v1"] = v1.is_in_bounds()
+        if not all(checks.values()):
+            return fail()
+
+        checks["consistent_c"] = (
+            _add_q(c0, c1) == c == _hash_elems(q, alpha, beta, a0, b0, a1, b1)
         )
+        if not checks["consistent_c"]:
+            return fail()
 
-        if not success:
-            log_warning(
-                "found an invalid Disjunctive Chaum-Pedersen proof: "
-                + str(
-                    {
-                        "in_bounds_alpha": in_bounds_alpha,
-                        "in_bounds_beta": in_bounds_beta,
-                        "in_bounds_a0": in_bounds_a0,
-                        "in_bounds_b0": in_bounds_b0,
-                        "in_bounds_a1": in_bounds_a1,
-                        "in_bounds_b1": in_bounds_b1,
-                        "in_bounds_c0": in_bounds_c0,
-                        "in_bounds_c1": in_bounds_c1,
-                        "in_bounds_v0": in_bounds_v0,
-                        "in_bounds_v1": in_bounds_v1,
-                        "consistent_c": consistent_c,
-                        "consistent_gv0": consistent_gv0,
-                        "consistent_gv1": consistent_gv1,
-                        "consistent_kv0": consistent_kv0,
-                        "consistent_gc1kv1": consistent_gc1kv1,
-                        "k": k,
-                        "proof": self,
-                    }
-                ),
-            )
-        return success
+        # alpha and beta are each raised to both challenges, so one windowed
+        # table per base is shared across the two exponentiations.
+        alpha_table = _make_base_table(alpha, _BASE_TABLE_WINDOW)
+        beta_table = _make_base_table(beta, _BASE_TABLE_WINDOW)
+
+        checks["consistent_gv0"] = _g_pow_p(v0) == _mult_p(
+            a0, _pow_p_with_table(alpha_table, c0, _BASE_TABLE_WINDOW)
+        )
+        if not checks["consistent_gv0"]:
+            return fail()
+        checks["consistent_gv1"] = _g_pow_p(v1) == _mult_p(
+            a1, _pow_p_with_table(alpha_table, c1, _BASE_TABLE_WINDOW)
+        )
+        if not checks["consistent_gv1"]:
+            return fail()
+        checks["consistent_kv0"] = _pow_pk(k, v0) == _mult_p(
+            b0, _pow_p_with_table(beta_table, c0, _BASE_TABLE_WINDOW)
+        )
+        if not checks["consistent_kv0"]:
+            return fail()
+        # with both g and k backed by cached fixed-base tables, computing the
+        # two powers separately beats a fused per-call Straus evaluation
+        checks["consistent_gc1kv1"] = _mult_p(_g_pow_p(c1), _pow_pk(k, v1)) == _mult_p(
+            b1, _pow_p_with_table(beta_table, c1, _BASE_TABLE_WINDOW)
+        )
+        if not checks["consistent_gc1kv1"]:
+            return fail()
+        return True
 
 
 @dataclass
@@ -202,16 +256,21 @@ class ChaumPedersenProof(Proof):
             and in_bounds_a
             and in_bounds_c
             # The equation 𝑔^𝑣𝑖 = 𝑎𝑖𝐾^𝑐𝑖
-            and g_pow_p(v) == mult_p(a, pow_p(k, c))
+            and g_pow_p(v) == mult_p(a, pow_pk(k, c))
         )
 
-        # The equation 𝐴^𝑣𝑖 = 𝑏𝑖𝑀𝑖^𝑐𝑖 mod 𝑝
+        def consistent_av_check() -> bool:
+            # The equation 𝐴^𝑣𝑖 = 𝑏𝑖𝑀𝑖^𝑐𝑖 mod 𝑝; neither base is fixed
+            # across calls, so the two powers go through one fused batch
+            alpha_v, m_c = powmod_batch([alpha, m], [v, c])
+            return alpha_v == mult_p(b, m_c)
+
         consistent_av = (
             in_bounds_alpha
             and in_bounds_b
             and in_bounds_c
             and in_bounds_v
-            and pow_p(alpha, v) == mult_p(b, pow_p(m, c))
+            and consistent_av_check()
         )
 
         success = (
@@ -230,27 +289,25 @@ class ChaumPedersenProof(Proof):
         )
 
         if not success:
-            log_warning(
-                "found an invalid Chaum-Pedersen proof: "
-                + str(
-                    {
-                        "in_bounds_alpha": in_bounds_alpha,
-                        "in_bounds_beta": in_bounds_beta,
-                        "in_bounds_k": in_bounds_k,
-                        "in_bounds_m": in_bounds_m,
-                        "in_bounds_a": in_bounds_a,
-                        "in_bounds_b": in_bounds_b,
-                        "in_bounds_c": in_bounds_c,
-                        "in_bounds_v": in_bounds_v,
-                        "in_bounds_q": in_bounds_q,
-                        "same_c": same_c,
-                        "consistent_gv": consistent_gv,
-                        "consistent_av": consistent_av,
-                        "k": k,
-                        "q": q,
-                        "proof": self,
-                    }
-                ),
+            return _log_and_false(
+                "Chaum-Pedersen",
+                lambda: {
+                    "in_bounds_alpha": in_bounds_alpha,
+                    "in_bounds_beta": in_bounds_beta,
+                    "in_bounds_k": in_bounds_k,
+                    "in_bounds_m": in_bounds_m,
+                    "in_bounds_a": in_bounds_a,
+                    "in_bounds_b": in_bounds_b,
+                    "in_bounds_c": in_bounds_c,
+                    "in_bounds_v": in_bounds_v,
+                    "in_bounds_q": in_bounds_q,
+                    "same_c": same_c,
+                    "consistent_gv": consistent_gv,
+                    "consistent_av": consistent_av,
+                    "k": k.to_hex(),
+                    "q": q.to_hex(),
+                    "proof": _hex_fields(self),
+                },
             )
         return success
 
@@ -297,12 +354,6 @@ class ConstantChaumPedersenProof(Proof):
         c = self.challenge
         v = self.response
         constant = self.constant
-        in_bounds_alpha = alpha.is_valid_residue()
-        in_bounds_beta = beta.is_valid_residue()
-        in_bounds_a = a.is_valid_residue()
-        in_bounds_b = b.is_valid_residue()
-        in_bounds_c = c.is_in_bounds()
-        in_bounds_v = v.is_in_bounds()
         tmp = int_to_q(constant)
         if tmp is None:
             constant_q = ZERO_MOD_Q
@@ -311,60 +362,49 @@ class ConstantChaumPedersenProof(Proof):
             constant_q = tmp
             in_bounds_constant = True
 
+        checks: Dict[str, Any] = {}
+
+        def fail() -> bool:
+            return _log_and_false(
+                "Constant Chaum-Pedersen",
+                lambda: {**checks, "k": k.to_hex(), "proof": _hex_fields(self)},
+            )
+
+        # Evaluate the cheap range and membership checks first, so that
+        # malformed proofs never pay for the modexp-heavy consistency
+        # checks below.
+        checks["in_bounds_alpha"] = alpha.is_valid_residue()
+        checks["in_bounds_beta"] = beta.is_valid_residue()
+        checks["in_bounds_a"] = a.is_valid_residue()
+        checks["in_bounds_b"] = b.is_valid_residue()
+        checks["in_bounds_c"] = c.is_in_bounds()
+        checks["in_bounds_v"] = v.is_in_bounds()
+        checks["in_bounds_constant"] = in_bounds_constant
         # this is an arbitrary constant check to verify that decryption will be performant
         # in some use cases this value may need to be increased
-        sane_constant = 0 <= constant < 1_000_000_000
-        same_c = c == hash_elems(q, alpha, beta, a, b)
-        consistent_gv = (
-            in_bounds_v
-            and in_bounds_a
-            and in_bounds_alpha
-            and in_bounds_c
-            # The equation 𝑔^𝑉 = 𝑎𝐴^𝐶 mod 𝑝
-            and g_pow_p(v) == mult_p(a, pow_p(alpha, c))
-        )
-
+        checks["sane_constant"] = 0 <= constant < 1_000_000_000
+        if not all(checks.values()):
+            return fail()
+
+        checks["same_c"] = c == hash_elems(q, alpha, beta, a, b)
+        if not checks["same_c"]:
+            return fail()
+        # The equation 𝑔^𝑉 = 𝑎𝐴^𝐶 mod 𝑝
+        checks["consistent_gv"] = g_pow_p(v) == mult_p(a, pow_p(alpha, c))
+        if not checks["consistent_gv"]:
+            return fail()
         # The equation 𝑔^𝐿𝐾^𝑣 = 𝑏𝐵^𝐶 mod 𝑝
-        consistent_kv = in_bounds_constant and mult_p(
-            g_pow_p(mult_p(c, constant_q)), pow_p(k, v)
-        ) == mult_p(b, pow_p(beta, c))
-
-        success = (
-            in_bounds_alpha
-            and in_bounds_beta
-            and in_bounds_a
-            and in_bounds_b
-            and in_bounds_c
-            and in_bounds_v
-            and same_c
-            and in_bounds_constant
-            and sane_constant
-            and consistent_gv
-            and consistent_kv
-        )
-
-        if not success:
-            log_warning(
-                "found an invalid Constant Chaum-Pedersen proof: "
-                + str(
-                    {
-                        "in_bounds_alpha": in_bounds_alpha,
-                        "in_bounds_beta": in_bounds_beta,
-                        "in_bounds_a": in_bounds_a,
-                        "in_bounds_b": in_bounds_b,
-                        "in_bounds_c": in_bounds_c,
-                        "in_bounds_v": in_bounds_v,
-                        "in_bounds_constant": in_bounds_constant,
-                        "sane_constant": sane_constant,
-                        "same_c": same_c,
-                        "consistent_gv": consistent_gv,
-                        "consistent_kv": consistent_kv,
-                        "k": k,
-                        "proof": self,
-                    }
-                ),
-            )
-        return success
+        if constant == 0:
+            # 𝑔^(𝐶·𝐿) is 1 when 𝐿 is zero, which is the common case (most
+            # selections on a ballot are unset), so skip that modexp entirely.
+            checks["consistent_kv"] = pow_pk(k, v) == mult_p(b, pow_p(beta, c))
+        else:
+            checks["consistent_kv"] = mult_p(
+                g_pow_p(mult_p(c, constant_q)), pow_pk(k, v)
+            ) == mult_p(b, pow_p(beta, c))
+        if not checks["consistent_kv"]:
+            return fail()
+        return True
 
 
 def make_disjunctive_chaum_pedersen(
@@ -418,13 +458,13 @@ def make_disjunctive_chaum_pedersen_zero(
     beta = message.data
 
     # Pick three random numbers in Q.
-    c1, v, u0 = Nonces(seed, "disjoint-chaum-pedersen-proof")[0:3]
+    c1, v, u0 = Nonces(seed, "disjoint-chaum-pedersen-proof").take(3)
 
     # Compute the NIZKP
     a0 = g_pow_p(u0)
-    b0 = pow_p(k, u0)
+    b0 = pow_pk(k, u0)
     a1 = g_pow_p(v)
-    b1 = mult_p(pow_p(k, v), g_pow_p(c1))
+    b1 = mult_p(pow_pk(k, v), g_pow_p(c1))
     c = hash_elems(q, alpha, beta, a0, b0, a1, b1)
     c0 = a_minus_b_q(c, c1)
     v0 = a_plus_bc_q(u0, c0, r)
@@ -454,13 +494,13 @@ def make_disjunctive_chaum_pedersen_one(
     beta = message.data
 
     # Pick three random numbers in Q.
-    w, v, u1 = Nonces(seed, "disjoint-chaum-pedersen-proof")[0:3]
+    w, v, u1 = Nonces(seed, "disjoint-chaum-pedersen-proof").take(3)
 
     # Compute the NIZKP
     a0 = g_pow_p(v)
-    b0 = mult_p(pow_p(k, v), g_pow_p(w))
+    b0 = mult_p(pow_pk(k, v), g_pow_p(w))
     a1 = g_pow_p(u1)
-    b1 = pow_p(k, u1)
+    b1 = pow_pk(k, u1)
     c = hash_elems(q, alpha, beta, a0, b0, a1, b1)
     c0 = negate_q(w)
     c1 = add_q(c, w)
@@ -526,8 +566,99 @@ def make_constant_chaum_pedersen(
     # Pick one random number in Q.
     u = Nonces(seed, "constant-chaum-pedersen-proof")[0]
     a = g_pow_p(u)  # 𝑔^𝑢𝑖 mod 𝑝
-    b = pow_p(k, u)  # 𝐴^𝑢𝑖 mod 𝑝
+    b = pow_pk(k, u)  # 𝐴^𝑢𝑖 mod 𝑝
     c = hash_elems(hash_header, alpha, beta, a, b)  # sha256(𝑄', A, B, a, b)
     v = a_plus_bc_q(u, c, r)
 
     return ConstantChaumPedersenProof(a, b, c, v, constant)
+
+
+class DisjunctiveVerifier:
+    """
+    Verifier for disjunctive Chaum-Pedersen proofs against one election key.
+
+    At tally time the public key is constant over millions of verifications,
+    so the per-election precomputed state — the fixed-base windowed tables
+    for the generator and for the key — is warmed once at construction
+    instead of lazily on the first proof. Verification itself delegates to
+    `DisjunctiveChaumPedersenProof.is_valid`, which finds the warm tables in
+    the group-level caches.
+    """
+
+    def __init__(self, k: ElementModP) -> None:
+        self.k = k
+        g_pow_p(ZERO_MOD_Q)
+        pow_pk(k, ZERO_MOD_Q)
+
+    def verify(
+        self,
+        message: ElGamalCiphertext,
+        proof: DisjunctiveChaumPedersenProof,
+        q: ElementModQ,
+    ) -> bool:
+        """Validate `proof` for `message` against this verifier's key."""
+        return proof.is_valid(message, self.k, q)
+
+
+@lru_cache(maxsize=8)
+def get_disjunctive_verifier(k: ElementModP) -> DisjunctiveVerifier:
+    """
+    Get a memoized `DisjunctiveVerifier` for the given public key.
+
+    Only a handful of keys are ever live in one process, so a small cache
+    keeps repeated lookups from rebuilding verifier state.
+    """
+    return DisjunctiveVerifier(k)
+
+
+def _verify_disjunctive_chunk(
+    chunk: List[Tuple[ElGamalCiphertext, DisjunctiveChaumPedersenProof]],
+    k: ElementModP,
+    q: ElementModQ,
+) -> List[bool]:
+    """Verify a chunk of disjunctive proofs; worker task for `verify_disjunctive_batch`."""
+    verifier = get_disjunctive_verifier(k)
+    return [verifier.verify(message, proof, q) for (message, proof) in chunk]
+
+
+def verify_disjunctive_batch(
+    items: List[Tuple[ElGamalCiphertext, DisjunctiveChaumPedersenProof]],
+    k: ElementModP,
+    q: ElementModQ,
+    scheduler: Optional[Scheduler] = None,
+) -> List[bool]:
+    """
+    Verify a batch of disjunctive Chaum-Pedersen proofs in parallel.
+
+    Each proof verifies independently of the others, so the batch is
+    distributed across the scheduler's process pool. Items are handed to the
+    workers in one contiguous chunk per core, rather than one task per proof:
+    the public key and extended base hash are then marshalled once per chunk,
+    and each worker amortizes its fixed-base table setup over thousands of
+    proofs. At tally scale this is the dominant verification cost, and the
+    work is purely compute-bound, so throughput scales roughly linearly with
+    cores.
+
+    The batch is kept in its natural row layout rather than transposed into
+    per-field columns: every field of every proof feeds a modexp with a
+    distinct base or exponent, so there is no shared column-wise kernel to
+    vectorize, and `is_valid` already unpacks each proof's fields into locals
+    exactly once before its hot loop.
+
+    :param items: (message, proof) pairs to verify
+    :param k: The public key of the election
+    :param q: The extended base hash of the election
+    :param scheduler: Scheduler
+    :return: The validity of each pair, in input order.
+    """
+    if not items:
+        return []
+    if scheduler is None:
+        scheduler = Scheduler()
+
+    chunk_size = -(-len(items) // Scheduler.cpu_count())
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    results: List[List[bool]] = scheduler.schedule(
+        _verify_disjunctive_chunk, [(chunk, k, q) for chunk in chunks]
+    )
+    return [valid for chunk_results in results for valid in chunk_results]
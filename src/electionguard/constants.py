@@ -1,4 +1,5 @@
 """Creating and managing mathematic constants for the election."""
+from functools import lru_cache
 from os import getenv
 
 from dataclasses import dataclass
@@ -61,13 +62,9 @@ class PrimeOption(Enum):
     TestOnly = "TestOnly"
 
 
-def get_constants() -> ElectionConstants:
-    """Get constants for the election by the option for the primes."""
-    env_option = getenv("PRIME_OPTION")
-    option: PrimeOption = (
-        PrimeOption(env_option) if env_option is not None else PrimeOption.Standard
-    )
-
+@lru_cache
+def _get_constants_for_option(option: PrimeOption) -> ElectionConstants:
+    """Get the constants corresponding to an option for the primes."""
     option_map = {
         PrimeOption.Standard: STANDARD_CONSTANTS,
         PrimeOption.TestOnly: LARGE_TEST_CONSTANTS,
@@ -75,6 +72,20 @@ def get_constants() -> ElectionConstants:
     return option_map.get(option) or STANDARD_CONSTANTS
 
 
+def get_constants() -> ElectionConstants:
+    """
+    Get constants for the election by the option for the primes.
+
+    The per-option lookup is memoized: this is called for every modular
+    operation, so it only reads the environment and returns a cached object.
+    """
+    env_option = getenv("PRIME_OPTION")
+    option: PrimeOption = (
+        PrimeOption(env_option) if env_option is not None else PrimeOption.Standard
+    )
+    return _get_constants_for_option(option)
+
+
 get_large_prime = lambda: get_constants().large_prime
 get_small_prime = lambda: get_constants().small_prime
 get_cofactor = lambda: get_constants().cofactor
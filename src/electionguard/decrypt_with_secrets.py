@@ -89,7 +89,7 @@ def decrypt_selection_with_nonce(
         nonce = selection.nonce
     else:
         nonce_sequence = Nonces(description.crypto_hash(), nonce_seed)
-        nonce = nonce_sequence[description.sequence_order]
+        nonce = nonce_sequence.get_nonzero(description.sequence_order)
 
     if nonce is None:
         log_warning(
@@ -181,7 +181,7 @@ def encrypt_selection(
 
     selection_description_hash = selection_description.crypto_hash()
     nonce_sequence = Nonces(selection_description_hash, nonce_seed)
-    selection_nonce = nonce_sequence[selection_description.sequence_order]
+    selection_nonce = nonce_sequence.get_nonzero(selection_description.sequence_order)
     disjunctive_chaum_pedersen_nonce = next(iter(nonce_sequence))
 
     log_info(
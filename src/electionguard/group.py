@@ -6,7 +6,10 @@ made about timing or other side-channels.
 """
 
 from abc import ABC
-from typing import Any, Final, Optional, Union
+from collections import OrderedDict
+from functools import lru_cache
+from os import getenv
+from typing import Any, Final, List, Optional, Sequence, Tuple, Union
 from base64 import b16decode
 from secrets import randbelow
 from sys import maxsize
@@ -14,12 +17,22 @@ from sys import maxsize
 # pylint: disable=no-name-in-module
 from gmpy2 import mpz, powmod, invert
 
+try:
+    # C-loop batched variants; experimental additions in gmpy2 2.1
+    from gmpy2 import powmod_base_list, powmod_exp_list
+except ImportError:  # pragma: no cover
+    powmod_base_list = None
+    powmod_exp_list = None
+
 from .constants import get_large_prime, get_small_prime, get_generator
 
 
 class BaseElement(ABC, int):
     """An element limited by mod T within [0, T) where T is determined by an upper_bound function."""
 
+    _mpz: mpz
+    _hash_bytes: bytes
+
     def __new__(cls, elem: Union[int, str], check_within_bounds: bool = True):  # type: ignore
         """Instantiate ElementModT where elem is an int or its hex representation or mpz."""
         if isinstance(elem, str):
@@ -62,6 +75,35 @@ class BaseElement(ABC, int):
         """
         return b16decode(self.to_hex())
 
+    def to_hash_bytes(self) -> bytes:
+        """
+        The UTF-8 bytes of the hex representation, as fed into `hash_elems`.
+
+        Memoized on the element, since elements are immutable and large
+        elements get hashed repeatedly during proof generation and
+        verification.
+        """
+        cached: Optional[bytes] = getattr(self, "_hash_bytes", None)
+        if cached is None:
+            cached = self.to_hex().encode("utf-8")
+            self._hash_bytes = cached
+        return cached
+
+    def to_mpz(self) -> mpz:
+        """
+        The element as a gmpy2 mpz.
+
+        Memoized on the element: elements are immutable, and the same element
+        is typically fed to several modular operations (e.g. a public key
+        across every proof in a ballot), so each one only pays for the
+        int-to-mpz conversion once.
+        """
+        cached: Optional[mpz] = getattr(self, "_mpz", None)
+        if cached is None:
+            cached = mpz(self)
+            self._mpz = cached
+        return cached
+
     def is_in_bounds(self) -> bool:
         """
         Validate that the element is actually within the bounds of [0,Q).
@@ -80,7 +122,16 @@ class BaseElement(ABC, int):
 
 
 class ElementModQ(BaseElement):
-    """An element of the larger `mod p` space, i.e., in [0, P), where P is a 4096-bit prime."""
+    """
+    An element of the smaller `mod q` space, i.e., in [0, Q), where Q is a 256-bit prime.
+
+    Values are plain Python ints via `BaseElement`. A packed four-limb native
+    representation was considered and rejected: elements flow through
+    hashing, JSON serialization, and pickling as ints, and the mod-q
+    arithmetic they feed is a rounding error next to the 4096-bit mod-p
+    exponentiations, so a second representation would add conversion cost
+    and API surface without a measurable win.
+    """
 
     @classmethod
     def get_upper_bound(cls) -> int:
@@ -118,10 +169,23 @@ ElementModPorInt = Union[ElementModP, int]
 
 
 def _get_mpz(input: Union[BaseElement, int]) -> mpz:
-    """Get BaseElement or integer as mpz."""
+    """Get BaseElement or integer as mpz, memoized on elements via `to_mpz`."""
+    if isinstance(input, BaseElement):
+        return input.to_mpz()
     return mpz(input)
 
 
+@lru_cache
+def _mpz_constant(value: int) -> mpz:
+    """
+    Get one of the election constants as mpz.
+
+    Memoized so the moduli, which appear in every modular operation, are
+    converted once per set of election constants rather than once per call.
+    """
+    return mpz(value)
+
+
 def hex_to_int(input: str) -> int:
     """Given a hex string representing bytes, returns an int."""
     return int(input, 16)
@@ -185,48 +249,46 @@ def int_to_p(input: int) -> Optional[ElementModP]:
 
 def add_q(*elems: ElementModQorInt) -> ElementModQ:
     """Add together one or more elements in Q, returns the sum mod Q."""
-    sum = _get_mpz(0)
+    small_prime = _mpz_constant(get_small_prime())
+    sum = mpz(0)
     for e in elems:
-        e = _get_mpz(e)
-        sum = (sum + e) % get_small_prime()
-    return ElementModQ(sum)
+        sum = (sum + _get_mpz(e)) % small_prime
+    return ElementModQ(sum, False)
 
 
 def a_minus_b_q(a: ElementModQorInt, b: ElementModQorInt) -> ElementModQ:
     """Compute (a-b) mod q."""
-    a = _get_mpz(a)
-    b = _get_mpz(b)
-    return ElementModQ((a - b) % get_small_prime())
+    return ElementModQ(
+        (_get_mpz(a) - _get_mpz(b)) % _mpz_constant(get_small_prime()), False
+    )
 
 
 def div_p(a: ElementModPOrQorInt, b: ElementModPOrQorInt) -> ElementModP:
     """Compute a/b mod p."""
-    b = _get_mpz(b)
-    inverse = invert(b, _get_mpz(get_large_prime()))
+    inverse = invert(_get_mpz(b), _mpz_constant(get_large_prime()))
     return mult_p(a, inverse)
 
 
 def div_q(a: ElementModPOrQorInt, b: ElementModPOrQorInt) -> ElementModQ:
     """Compute a/b mod q."""
-    b = _get_mpz(b)
-    inverse = invert(b, _get_mpz(get_small_prime()))
+    inverse = invert(_get_mpz(b), _mpz_constant(get_small_prime()))
     return mult_q(a, inverse)
 
 
 def negate_q(a: ElementModQorInt) -> ElementModQ:
     """Compute (Q - a) mod q."""
-    a = _get_mpz(a)
-    return ElementModQ(get_small_prime() - a)
+    small_prime = _mpz_constant(get_small_prime())
+    return ElementModQ((small_prime - _get_mpz(a)) % small_prime, False)
 
 
 def a_plus_bc_q(
     a: ElementModQorInt, b: ElementModQorInt, c: ElementModQorInt
 ) -> ElementModQ:
     """Compute (a + b * c) mod q."""
-    a = _get_mpz(a)
-    b = _get_mpz(b)
-    c = _get_mpz(c)
-    return ElementModQ((a + b * c) % get_small_prime())
+    return ElementModQ(
+        (_get_mpz(a) + _get_mpz(b) * _get_mpz(c)) % _mpz_constant(get_small_prime()),
+        False,
+    )
 
 
 def mult_inv_p(e: ElementModPOrQorInt) -> ElementModP:
@@ -237,19 +299,56 @@ def mult_inv_p(e: ElementModPOrQorInt) -> ElementModP:
     """
     e = _get_mpz(e)
     assert e != 0, "No multiplicative inverse for zero"
-    return ElementModP(powmod(e, -1, get_large_prime()))
+    return ElementModP(powmod(e, -1, _mpz_constant(get_large_prime())), False)
 
 
 def pow_p(b: ElementModPOrQorInt, e: ElementModPOrQorInt) -> ElementModP:
     """
     Compute b^e mod p.
 
+    Delegates to gmpy2's `powmod`, which already performs the exponentiation
+    in Montgomery form internally (GMP converts the base once, runs the whole
+    square-and-multiply chain with REDC reductions, and converts back), so no
+    explicit Montgomery-representation layer is maintained on the Python side.
+
     :param b: An element in [0,P).
     :param e: An element in [0,P).
     """
-    b = _get_mpz(b)
-    e = _get_mpz(e)
-    return ElementModP(powmod(b, e, get_large_prime()))
+    return ElementModP(
+        powmod(_get_mpz(b), _get_mpz(e), _mpz_constant(get_large_prime())), False
+    )
+
+
+def powmod_batch(
+    bases: List[ElementModPOrQorInt], exps: List[ElementModPOrQorInt]
+) -> List[ElementModP]:
+    """
+    Compute bases[i]^exps[i] mod p for every i, as one fused call.
+
+    The modulus is converted once and the whole batch runs over gmpy2 values
+    without re-entering element construction between items. When every item
+    shares a single base (or a single exponent), the batch additionally
+    dispatches through gmpy2's `powmod_exp_list`/`powmod_base_list`, which
+    run the loop in C and release the GIL; those entry points appeared in
+    gmpy2 2.1, so older installations fall back to the per-item loop.
+
+    :param bases: Elements in [0,P), one per exponentiation.
+    :param exps: Elements in [0,P), one per exponentiation.
+    """
+    if len(bases) != len(exps):
+        raise ValueError("powmod_batch requires equally many bases and exponents")
+    if not bases:
+        return []
+    large_prime = _mpz_constant(get_large_prime())
+    base_mpzs = [_get_mpz(b) for b in bases]
+    exp_mpzs = [_get_mpz(e) for e in exps]
+    if powmod_exp_list is not None and all(b == base_mpzs[0] for b in base_mpzs):
+        results = powmod_exp_list(base_mpzs[0], exp_mpzs, large_prime)
+    elif powmod_base_list is not None and all(e == exp_mpzs[0] for e in exp_mpzs):
+        results = powmod_base_list(base_mpzs, exp_mpzs[0], large_prime)
+    else:
+        results = [powmod(b, e, large_prime) for b, e in zip(base_mpzs, exp_mpzs)]
+    return [ElementModP(result, False) for result in results]
 
 
 def pow_q(b: ElementModQorInt, e: ElementModQorInt) -> ElementModQ:
@@ -259,9 +358,9 @@ def pow_q(b: ElementModQorInt, e: ElementModQorInt) -> ElementModQ:
     :param b: An element in [0,Q).
     :param e: An element in [0,Q).
     """
-    b = _get_mpz(b)
-    e = _get_mpz(e)
-    return ElementModQ(powmod(b, e, get_small_prime()))
+    return ElementModQ(
+        powmod(_get_mpz(b), _get_mpz(e), _mpz_constant(get_small_prime())), False
+    )
 
 
 def mult_p(*elems: ElementModPOrQorInt) -> ElementModP:
@@ -270,11 +369,11 @@ def mult_p(*elems: ElementModPOrQorInt) -> ElementModP:
 
     :param elems: Zero or more elements in [0,P).
     """
-    product = _get_mpz(1)
+    large_prime = _mpz_constant(get_large_prime())
+    product = mpz(1)
     for x in elems:
-        x = _get_mpz(x)
-        product = (product * x) % get_large_prime()
-    return ElementModP(product)
+        product = (product * _get_mpz(x)) % large_prime
+    return ElementModP(product, False)
 
 
 def mult_q(*elems: ElementModPOrQorInt) -> ElementModQ:
@@ -283,20 +382,253 @@ def mult_q(*elems: ElementModPOrQorInt) -> ElementModQ:
 
     :param elems: Zero or more elements in [0,Q).
     """
-    product = _get_mpz(1)
+    small_prime = _mpz_constant(get_small_prime())
+    product = mpz(1)
     for x in elems:
-        x = _get_mpz(x)
-        product = (product * x) % get_small_prime()
-    return ElementModQ(product)
+        product = (product * _get_mpz(x)) % small_prime
+    return ElementModQ(product, False)
+
+
+def make_base_table(base: ElementModPOrQorInt, window_size: int) -> List[ElementModP]:
+    """
+    Precompute the table [base^0, base^1, ..., base^(2^window_size - 1)] mod p.
+
+    Build this once for a base that will be raised to several different
+    exponents, then evaluate each exponentiation with `pow_p_with_table`; the
+    cost of the table is amortized across the exponentiations.
+
+    :param base: An element in [0,P).
+    :param window_size: Width of the exponent windows, in bits.
+    """
+    large_prime = _mpz_constant(get_large_prime())
+    base = _get_mpz(base)
+    entry = mpz(1)
+    table = [ElementModP(entry, False)]
+    for _ in range(1, 1 << window_size):
+        entry = (entry * base) % large_prime
+        table.append(ElementModP(entry, False))
+    return table
+
+
+def pow_p_with_table(
+    table: List[ElementModP], e: ElementModPOrQorInt, window_size: int
+) -> ElementModP:
+    """
+    Compute base^e mod p, where `table` was built from the base by `make_base_table`.
+
+    Scans the exponent `window_size` bits at a time from the most significant
+    end, squaring the accumulator and multiplying in one table entry per
+    window, so the multiplies of a generic square-and-multiply are replaced by
+    table lookups.
+
+    :param table: A table built by `make_base_table` with the same window size.
+    :param e: An element in [0,P).
+    :param window_size: Width of the exponent windows, in bits.
+    """
+    large_prime = _mpz_constant(get_large_prime())
+    e = _get_mpz(e)
+    mask = (1 << window_size) - 1
+    num_windows = (e.bit_length() + window_size - 1) // window_size
+    result = mpz(1)
+    for k in range(num_windows - 1, -1, -1):
+        if result != 1:
+            for _ in range(window_size):
+                result = (result * result) % large_prime
+        window = (e >> (k * window_size)) & mask
+        if window:
+            result = (result * _get_mpz(table[window])) % large_prime
+    return ElementModP(result, False)
+
+
+def mult_exp_p(
+    base_exp_pairs: Sequence[Tuple[ElementModPOrQorInt, ElementModPOrQorInt]]
+) -> ElementModP:
+    """
+    Compute the product, mod p, of base^exponent over all (base, exponent) pairs.
+
+    Uses Straus's simultaneous-exponentiation algorithm: a small table of
+    powers is built per base, then a single accumulator is squared once per
+    window while each base contributes one table multiply. The squaring chain
+    is shared across all pairs, so this is substantially cheaper than
+    multiplying independent `pow_p` results together.
+
+    :param base_exp_pairs: Zero or more (base, exponent) pairs, each in [0,P).
+    """
+    large_prime = _mpz_constant(get_large_prime())
+    window_size = 4
+    mask = (1 << window_size) - 1
+    tables = []
+    exponents = []
+    max_bits = 1
+    for base, e in base_exp_pairs:
+        base = _get_mpz(base)
+        e = _get_mpz(e)
+        table = [mpz(1), base]
+        for _ in range(2, 1 << window_size):
+            table.append((table[-1] * base) % large_prime)
+        tables.append(table)
+        exponents.append(e)
+        max_bits = max(max_bits, e.bit_length())
+    num_windows = (max_bits + window_size - 1) // window_size
+    result = mpz(1)
+    for k in range(num_windows - 1, -1, -1):
+        if result != 1:
+            for _ in range(window_size):
+                result = (result * result) % large_prime
+        shift = k * window_size
+        for table, e in zip(tables, exponents):
+            window = (e >> shift) & mask
+            if window:
+                result = (result * table[window]) % large_prime
+    return ElementModP(result, False)
+
+
+DEFAULT_FIXED_BASE_WINDOW: Final[int] = 10
+"""Default window width, in bits, for fixed-base exponentiation tables."""
+
+
+def _get_fixed_base_window() -> int:
+    """
+    Get the window width for fixed-base exponentiation tables.
+
+    Configurable via the `EG_FIXED_BASE_WINDOW` environment variable to trade
+    table memory (2^w entries per window) against multiplications (one per w
+    bits of exponent).
+    """
+    return int(getenv("EG_FIXED_BASE_WINDOW", str(DEFAULT_FIXED_BASE_WINDOW)))
+
+
+class _FixedBasePowTable:
+    """
+    Precomputed table for fixed-base modular exponentiation.
+
+    Holds `base^(i * 2^(k*w))` mod `modulus` for each w-bit window k of the
+    exponent and each window value i, so an exponentiation becomes one table
+    lookup and one modular multiplication per w bits of exponent, rather than
+    the generic square-and-multiply performed by `powmod`. Worthwhile when the
+    same base is reused across many exponentiations, as the generator is.
+    """
+
+    def __init__(
+        self, base: int, modulus: int, exponent_bits: int, window_size: int
+    ) -> None:
+        self.base = base
+        self.modulus = modulus
+        self.window_size = window_size
+        self._modulus = mpz(modulus)
+        self._mask = (1 << window_size) - 1
+        num_windows = (exponent_bits + window_size - 1) // window_size
+        self.exponent_bits = num_windows * window_size
+        table: List[List[mpz]] = []
+        row_base = mpz(base)
+        for _ in range(num_windows):
+            row = [mpz(1)]
+            for _ in range(1, 1 << window_size):
+                row.append((row[-1] * row_base) % self._modulus)
+            table.append(row)
+            row_base = (row[-1] * row_base) % self._modulus
+        self._table = table
+
+    def pow(self, e: ElementModPOrQorInt) -> Optional[mpz]:
+        """
+        Compute base^e mod modulus.
+
+        Returns `None` if the exponent is outside the range covered by the
+        table, in which case the caller should fall back to a generic path.
+        """
+        e = _get_mpz(e)
+        if not 0 <= e < (1 << self.exponent_bits):
+            return None
+        result = mpz(1)
+        for row in self._table:
+            window = e & self._mask
+            if window:
+                result = (result * row[window]) % self._modulus
+            e = e >> self.window_size
+        return result
+
+
+_FIXED_BASE_CACHE_SIZE: Final[int] = 8
+"""How many per-base fixed-base tables to keep cached at once."""
+
+_fixed_base_table_cache: "OrderedDict[Tuple[int, int, int], _FixedBasePowTable]" = (
+    OrderedDict()
+)
+
+
+def pow_pk(k: ElementModPOrQorInt, e: ElementModPOrQorInt) -> ElementModP:
+    """
+    Compute k^e mod p, using a cached fixed-base table for k.
+
+    Meant for bases that stay constant across many exponentiations, like an
+    election public key verified against millions of ballots: the first call
+    for a given k builds the same kind of windowed table `g_pow_p` uses for
+    the generator, and every later call is table lookups and multiplies. The
+    cache is a small LRU, since only a handful of long-lived bases (election
+    and guardian keys) are ever worth a table.
+
+    :param k: An element in [0,P).
+    :param e: An element in [0,P).
+    """
+    cache_key = (int(k), get_large_prime(), _get_fixed_base_window())
+    table = _fixed_base_table_cache.get(cache_key)
+    if table is None:
+        table = _FixedBasePowTable(
+            cache_key[0],
+            cache_key[1],
+            get_small_prime().bit_length(),
+            cache_key[2],
+        )
+        _fixed_base_table_cache[cache_key] = table
+        if len(_fixed_base_table_cache) > _FIXED_BASE_CACHE_SIZE:
+            _fixed_base_table_cache.popitem(last=False)
+    else:
+        _fixed_base_table_cache.move_to_end(cache_key)
+    result = table.pow(e)
+    if result is None:
+        return pow_p(k, e)
+    return ElementModP(result, False)
+
+
+_g_pow_p_table: Optional[_FixedBasePowTable] = None
+
+
+def _get_g_pow_p_table() -> _FixedBasePowTable:
+    """
+    Get the fixed-base table for the current generator, lazily building it.
+
+    The table is rebuilt whenever the election constants or the configured
+    window width change, so swapping `PRIME_OPTION` mid-process stays safe.
+    """
+    global _g_pow_p_table  # pylint: disable=global-statement
+    generator = get_generator()
+    large_prime = get_large_prime()
+    window_size = _get_fixed_base_window()
+    table = _g_pow_p_table
+    if (
+        table is None
+        or table.base != generator
+        or table.modulus != large_prime
+        or table.window_size != window_size
+    ):
+        table = _FixedBasePowTable(
+            generator, large_prime, get_small_prime().bit_length(), window_size
+        )
+        _g_pow_p_table = table
+    return table
 
 
 def g_pow_p(e: ElementModPOrQorInt) -> ElementModP:
     """
-    Compute g^e mod p.
+    Compute g^e mod p, using a precomputed fixed-base table for the generator.
 
     :param e: An element in [0,P).
     """
-    return pow_p(get_generator(), e)
+    result = _get_g_pow_p_table().pow(e)
+    if result is None:
+        # The exponent doesn't fit the table (it covers [0, 2^|Q|)); fall back.
+        return pow_p(get_generator(), e)
+    return ElementModP(result, False)
 
 
 def rand_q() -> ElementModQ:
@@ -305,7 +637,7 @@ def rand_q() -> ElementModQ:
 
     :return: Random value between 0 and Q
     """
-    return ElementModQ(randbelow(get_small_prime()))
+    return ElementModQ(randbelow(get_small_prime()), False)
 
 
 def rand_range_q(start: ElementModQorInt) -> ElementModQ:
@@ -319,4 +651,4 @@ def rand_range_q(start: ElementModQorInt) -> ElementModQ:
     random = 0
     while random < start:
         random = randbelow(get_small_prime())
-    return ElementModQ(random)
+    return ElementModQ(random, False)
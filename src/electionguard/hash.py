@@ -77,8 +77,12 @@ def hash_elems(*a: CRYPTO_HASHABLE_ALL) -> ElementModQ:
         # to exactly match this hash function.
 
         if isinstance(x, (ElementModP, ElementModQ)):
-            hash_me = x.to_hex()
-        elif isinstance(x, CryptoHashable):
+            # Feed the memoized serialized bytes directly to the digest,
+            # skipping a fresh hex conversion and string encode for every
+            # (frequently large, frequently re-hashed) element.
+            h.update(x.to_hash_bytes() + b"|")
+            continue
+        if isinstance(x, CryptoHashable):
             hash_me = x.crypto_hash().to_hex()
         elif isinstance(x, str):
             # strings are iterable, so it's important to handle them before list-like types
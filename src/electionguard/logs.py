@@ -2,13 +2,21 @@ import inspect
 import logging
 import os.path
 import sys
-from typing import Any, List, Tuple
+from typing import Any, Callable, List, Tuple, Union
 from logging.handlers import RotatingFileHandler
 
 from .singleton import Singleton
 
 FORMAT = "[%(process)d:%(asctime)s]:%(levelname)s:%(message)s"
 
+Message = Union[str, Callable[[], str]]
+"""A log message: either a string, or a zero-argument callable producing one.
+
+Callables are only invoked when the log level is enabled, so expensive
+diagnostic formatting (e.g. serializing 4096-bit elements) can be deferred
+and skipped entirely when the message would be discarded.
+"""
+
 
 class ElectionGuardLog(Singleton):
     """
@@ -62,34 +70,54 @@ class ElectionGuardLog(Singleton):
         """
         return self.__logger.handlers
 
-    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def debug(self, message: Message, *args: Any, **kwargs: Any) -> None:
         """
         Logs a debug message
         """
+        if not self.__logger.isEnabledFor(logging.DEBUG):
+            return
+        if callable(message):
+            message = message()
         self.__logger.debug(self.__formatted_message(message), *args, **kwargs)
 
-    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def info(self, message: Message, *args: Any, **kwargs: Any) -> None:
         """
         Logs a info message
         """
+        if not self.__logger.isEnabledFor(logging.INFO):
+            return
+        if callable(message):
+            message = message()
         self.__logger.info(self.__formatted_message(message), *args, **kwargs)
 
-    def warn(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def warn(self, message: Message, *args: Any, **kwargs: Any) -> None:
         """
         Logs a warning message
         """
+        if not self.__logger.isEnabledFor(logging.WARNING):
+            return
+        if callable(message):
+            message = message()
         self.__logger.warning(self.__formatted_message(message), *args, **kwargs)
 
-    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def error(self, message: Message, *args: Any, **kwargs: Any) -> None:
         """
         Logs a error message
         """
+        if not self.__logger.isEnabledFor(logging.ERROR):
+            return
+        if callable(message):
+            message = message()
         self.__logger.error(self.__formatted_message(message), *args, **kwargs)
 
-    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
+    def critical(self, message: Message, *args: Any, **kwargs: Any) -> None:
         """
         Logs a critical message
         """
+        if not self.__logger.isEnabledFor(logging.CRITICAL):
+            return
+        if callable(message):
+            message = message()
         self.__logger.critical(self.__formatted_message(message), *args, **kwargs)
 
 
@@ -144,35 +172,35 @@ def log_handlers() -> List[logging.Handler]:
     return LOG.handlers()
 
 
-def log_debug(msg: str, *args: Any, **kwargs: Any) -> None:
+def log_debug(msg: Message, *args: Any, **kwargs: Any) -> None:
     """
     Logs a debug message to the console and the file log.
     """
     LOG.debug(msg, *args, **kwargs)
 
 
-def log_info(msg: str, *args: Any, **kwargs: Any) -> None:
+def log_info(msg: Message, *args: Any, **kwargs: Any) -> None:
     """
     Logs an information message to the console and the file log.
     """
     LOG.info(msg, *args, **kwargs)
 
 
-def log_warning(msg: str, *args: Any, **kwargs: Any) -> None:
+def log_warning(msg: Message, *args: Any, **kwargs: Any) -> None:
     """
     Logs a warning message to the console and the file log.
     """
     LOG.warn(msg, *args, **kwargs)
 
 
-def log_error(msg: str, *args: Any, **kwargs: Any) -> None:
+def log_error(msg: Message, *args: Any, **kwargs: Any) -> None:
     """
     Logs an error message to the console and the file log.
     """
     LOG.error(msg, *args, **kwargs)
 
 
-def log_critical(msg: str, *args: Any, **kwargs: Any) -> None:
+def log_critical(msg: Message, *args: Any, **kwargs: Any) -> None:
     """
     Logs a critical message to the console and the file log.
     """
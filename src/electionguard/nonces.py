@@ -1,6 +1,8 @@
 # pylint: disable=too-many-ancestors
+from hashlib import shake_128
 from typing import Union, Sequence, List, overload
 
+from electionguard.constants import get_small_prime
 from electionguard.group import ElementModQ, ElementModPOrQ
 from electionguard.hash import hash_elems
 
@@ -46,6 +48,46 @@ class Nonces(Sequence[ElementModQ]):
     def __len__(self) -> int:
         raise TypeError("Nonces does not have finite length")
 
+    def take(self, count: int) -> List[ElementModQ]:
+        """
+        Gets a batch of `count` nonces derived from a single digest.
+
+        Where indexing performs one hash invocation per nonce, this squeezes
+        all `count * 32` bytes out of one SHAKE-128 digest of the seed and
+        slices them into elements, so proof constructors needing several
+        nonces at once only pay for a single derivation.
+
+        :param count: Number of nonces to derive.
+        """
+        if count < 0:
+            raise TypeError("Cannot take a negative number of nonces.")
+        small_prime = get_small_prime()
+        digest = shake_128(self.__seed.to_hash_bytes()).digest(count * 32)
+        return [
+            ElementModQ(
+                int.from_bytes(digest[i * 32 : (i + 1) * 32], "big") % small_prime
+            )
+            for i in range(count)
+        ]
+
+    def get_nonzero(self, item: int) -> ElementModQ:
+        """
+        Gets an item from the sequence, deterministically rehashing with a
+        retry header if the derived value is zero. Meant for uses like ElGamal
+        encryption that require a nonce in [1, Q): zero is vanishingly rare
+        with the standard 256-bit Q, but entirely reachable with the small
+        test-only primes. Encryption and decryption both re-derive through
+        this method, so they continue to agree on the nonce.
+
+        :param item: Index into the nonces.
+        """
+        nonce = self.get_with_headers(item)
+        attempt = 0
+        while nonce == 0:
+            attempt += 1
+            nonce = self.get_with_headers(item, f"retry-{attempt}")
+        return nonce
+
     def get_with_headers(self, item: int, *headers: str) -> ElementModQ:
         """
         Gets an item from the sequence at any offset. Headers can be included
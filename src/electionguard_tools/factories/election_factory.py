@@ -308,6 +308,9 @@ def get_contest_description_well_formed(
         selection: Tuple[str, SelectionDescription] = draw(selections)
         _, selection_description = selection
         selection_description.sequence_order = i
+        # the slot index also disambiguates the candidate: independent draws
+        # can collide, and a valid contest needs distinct candidate ids
+        selection_description.candidate_id = f"{selection_description.candidate_id}-{i}"
         selection_descriptions.append(selection_description)
 
     contest_description = ContestDescription(
@@ -5,7 +5,7 @@ Created by running `stubgen -p gmpy2`, and then modifying the output manually
 Necessary to support mypy typechecking
 """
 
-from typing import Union, Any, Tuple, Text, Optional
+from typing import Union, Any, Callable, List, Sequence, Tuple, Text, Optional
 
 class mpz(int):
     def __new__(
@@ -84,5 +84,11 @@ class mpz(int):
 
 def invert(x: mpz, m: mpz) -> mpz: ...
 def powmod(a: int, e: int, p: int) -> mpz: ...
+
+# Experimental additions in gmpy2 2.1; declared as Optional callables since
+# older installations lack them and importers fall back to None.
+powmod_base_list: Optional[Callable[[Sequence[int], int, int], List[mpz]]]
+powmod_exp_list: Optional[Callable[[int, Sequence[int], int], List[mpz]]]
+
 def to_binary(a: mpz) -> bytes: ...
 def from_binary(b: bytes) -> mpz: ...
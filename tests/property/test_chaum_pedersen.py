@@ -7,11 +7,13 @@ from tests.base_test_case import BaseTestCase
 
 from electionguard.chaum_pedersen import (
     ConstantChaumPedersenProof,
+    get_disjunctive_verifier,
     make_disjunctive_chaum_pedersen_zero,
     make_disjunctive_chaum_pedersen_one,
     make_chaum_pedersen,
     make_constant_chaum_pedersen,
     make_disjunctive_chaum_pedersen,
+    verify_disjunctive_batch,
 )
 from electionguard.elgamal import (
     ElGamalKeyPair,
@@ -52,6 +54,41 @@ class TestDisjunctiveChaumPedersen(BaseTestCase):
         self.assertTrue(proof1.is_valid(message1, keypair.public_key, ONE_MOD_Q))
         self.assertFalse(proof1bad.is_valid(message1, keypair.public_key, ONE_MOD_Q))
 
+    def test_djcp_batch_verification(self):
+        keypair = elgamal_keypair_from_secret(TWO_MOD_Q)
+        nonce = ONE_MOD_Q
+        seed = TWO_MOD_Q
+        message0 = get_optional(elgamal_encrypt(0, nonce, keypair.public_key))
+        message1 = get_optional(elgamal_encrypt(1, nonce, keypair.public_key))
+        proof0 = make_disjunctive_chaum_pedersen_zero(
+            message0, nonce, keypair.public_key, ONE_MOD_Q, seed
+        )
+        proof1 = make_disjunctive_chaum_pedersen_one(
+            message1, nonce, keypair.public_key, ONE_MOD_Q, seed
+        )
+        proof_bad = make_disjunctive_chaum_pedersen_one(
+            message0, nonce, keypair.public_key, ONE_MOD_Q, seed
+        )
+        results = verify_disjunctive_batch(
+            [(message0, proof0), (message1, proof1), (message0, proof_bad)],
+            keypair.public_key,
+            ONE_MOD_Q,
+        )
+        self.assertEqual([True, True, False], results)
+
+    def test_djcp_verifier_delegates_to_is_valid(self):
+        keypair = elgamal_keypair_from_secret(TWO_MOD_Q)
+        nonce = ONE_MOD_Q
+        seed = TWO_MOD_Q
+        message0 = get_optional(elgamal_encrypt(0, nonce, keypair.public_key))
+        proof0 = make_disjunctive_chaum_pedersen_zero(
+            message0, nonce, keypair.public_key, ONE_MOD_Q, seed
+        )
+        verifier = get_disjunctive_verifier(keypair.public_key)
+        self.assertTrue(verifier.verify(message0, proof0, ONE_MOD_Q))
+        # repeated lookups for the same key reuse the memoized verifier
+        self.assertIs(verifier, get_disjunctive_verifier(keypair.public_key))
+
     def test_djcp_proof_invalid_inputs(self):
         # this is here to push up our coverage
         keypair = elgamal_keypair_from_secret(TWO_MOD_Q)
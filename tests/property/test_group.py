@@ -27,6 +27,12 @@ from electionguard.group import (
     div_q,
     div_p,
     a_plus_bc_q,
+    make_base_table,
+    mult_exp_p,
+    pow_p,
+    pow_p_with_table,
+    pow_pk,
+    powmod_batch,
 )
 from electionguard.utils import (
     flatmap_optional,
@@ -132,6 +138,57 @@ class TestModularArithmetic(BaseTestCase):
         self.assertEqual(gp, g_pow_p(ONE_MOD_Q))
         self.assertEqual(ONE_MOD_P, g_pow_p(ZERO_MOD_Q))
 
+    @given(elements_mod_q())
+    def test_g_pow_p_matches_generic_pow_p(self, q: ElementModQ):
+        # the fixed-base table path must agree with the generic modexp
+        self.assertEqual(g_pow_p(q), pow_p(get_generator(), q))
+
+    @given(elements_mod_p_no_zero(), elements_mod_q(), elements_mod_q())
+    def test_mult_exp_p(self, p: ElementModP, q: ElementModQ, q2: ElementModQ):
+        # the fused simultaneous exponentiation must agree with separate pow_p calls
+        self.assertEqual(
+            mult_exp_p([(p, q), (get_generator(), q2)]),
+            mult_p(pow_p(p, q), pow_p(get_generator(), q2)),
+        )
+
+    def test_mult_exp_p_noargs(self):
+        self.assertEqual(ONE_MOD_P, mult_exp_p([]))
+
+    @given(elements_mod_p_no_zero(), elements_mod_q(), elements_mod_q())
+    def test_pow_pk_matches_pow_p(
+        self, p: ElementModP, q: ElementModQ, q2: ElementModQ
+    ):
+        # the cached fixed-base path must agree with the generic modexp,
+        # both on the first (table-building) call and on cache hits
+        self.assertEqual(pow_pk(p, q), pow_p(p, q))
+        self.assertEqual(pow_pk(p, q2), pow_p(p, q2))
+
+    @given(elements_mod_p_no_zero(), elements_mod_q(), elements_mod_q())
+    def test_pow_p_with_table(self, p: ElementModP, q: ElementModQ, q2: ElementModQ):
+        # one table, reused for two exponents, must agree with generic pow_p
+        table = make_base_table(p, 5)
+        self.assertEqual(pow_p_with_table(table, q, 5), pow_p(p, q))
+        self.assertEqual(pow_p_with_table(table, q2, 5), pow_p(p, q2))
+
+    @given(
+        elements_mod_p_no_zero(),
+        elements_mod_p_no_zero(),
+        elements_mod_q(),
+        elements_mod_q(),
+    )
+    def test_powmod_batch(
+        self, p: ElementModP, p2: ElementModP, q: ElementModQ, q2: ElementModQ
+    ):
+        # mixed bases and exponents must agree with per-item pow_p, as must
+        # the shared-base and shared-exponent fast paths
+        self.assertEqual(powmod_batch([p, p2], [q, q2]), [pow_p(p, q), pow_p(p2, q2)])
+        self.assertEqual(powmod_batch([p, p], [q, q2]), [pow_p(p, q), pow_p(p, q2)])
+        self.assertEqual(powmod_batch([p, p2], [q, q]), [pow_p(p, q), pow_p(p2, q)])
+
+    def test_powmod_batch_validates_lengths(self):
+        self.assertEqual([], powmod_batch([], []))
+        self.assertRaises(ValueError, powmod_batch, [ONE_MOD_P], [])
+
     @given(elements_mod_q())
     def test_in_bounds_q(self, q: ElementModQ):
         self.assertTrue(q.is_in_bounds())
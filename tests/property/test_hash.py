@@ -28,6 +28,13 @@ class TestHash(BaseTestCase):
         if ha != hb:
             self.assertNotEqual(a, b)
 
+    @given(elements_mod_p())
+    def test_hash_of_element_same_as_hash_of_its_hex(self, a: ElementModQ):
+        # the memoized byte path for elements must match hashing the hex string
+        self.assertEqual(hash_elems(a), hash_elems(a.to_hex()))
+        # and stay stable when the cached bytes are reused
+        self.assertEqual(hash_elems(a), hash_elems(a))
+
     def test_hash_for_zero_number_is_zero_string(self):
         self.assertEqual(hash_elems(0), hash_elems("0"))
 
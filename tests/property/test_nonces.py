@@ -54,8 +54,27 @@ class TestNonces(BaseTestCase):
         self.assertEqual(len(l2), 10)
         self.assertEqual(l, l2)
 
+    @given(elements_mod_q())
+    def test_nonces_take(self, seed: ElementModQ):
+        l1 = Nonces(seed).take(3)
+        l2 = Nonces(seed).take(3)
+        self.assertEqual(len(l1), 3)
+        self.assertEqual(l1, l2)
+        for q in l1:
+            self.assertTrue(q.is_in_bounds())
+
+    @given(elements_mod_q(), integers(min_value=0, max_value=1000000))
+    def test_nonces_get_nonzero(self, seed: ElementModQ, i: int):
+        n = Nonces(seed)
+        nonce = n.get_nonzero(i)
+        self.assertTrue(nonce.is_in_bounds_no_zero())
+        # agrees with plain indexing whenever that value is already nonzero
+        if n[i].is_in_bounds_no_zero():
+            self.assertEqual(n[i], nonce)
+
     def test_nonces_type_errors(self):
         n = Nonces(ElementModQ(3))
         self.assertRaises(TypeError, len, n)
         self.assertRaises(TypeError, lambda: n[1:])
         self.assertRaises(TypeError, lambda: n.get_with_headers(-1))
+        self.assertRaises(TypeError, lambda: n.take(-1))
@@ -28,6 +28,17 @@ class TestLogs(BaseTestCase):
         # Assert
         self.assertIsNotNone(message)
 
+    def test_log_lazy_message(self):
+        # Arrange
+        message = "test lazy log message"
+
+        # Act: callables are only invoked when the level is enabled
+        log_warning(lambda: message)
+        log_debug(lambda: self.fail("debug is disabled, so this must not run"))
+
+        # Assert
+        self.assertIsNotNone(message)
+
     def test_log_handlers(self):
         # Arrange
 